@@ -1,26 +1,59 @@
-from github import Github
-from github.GithubException import GithubException
-from typing import Optional
+import asyncio
+import base64
+import hashlib
+import httpx
+import time
+from typing import Optional, Union
+
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Seconds an idle connection to GitHub is kept open. Tool calls are usually spaced
+# further apart than httpx's 5s default, which would cost a new TLS handshake each time.
+KEEPALIVE_EXPIRY = 120
+
+# Blob uploads in flight at once, GitHub's secondary rate limits punish bursts of
+# concurrent content-creating requests
+MAX_CONCURRENT_UPLOADS = 5
+
+
+def blob_sha(data: bytes) -> str:
+    """Compute the git blob SHA of a file's content, as GitHub reports it."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _encode(content: Union[str, bytes]) -> bytes:
+    """Get the bytes of file content, passing already encoded content through as is."""
+    return content if isinstance(content, bytes) else content.encode('utf-8')
 
 
 class GitRepository:
     """
-    A class to manage GitHub repository operations including file writing, 
+    A class to manage GitHub repository operations including file writing,
     committing, pushing, and force syncing with local repository.
     """
-    
-    def __init__(self, url: str, api_token: str, default_branch: str = None):
+
+    def __init__(self, url: str, api_token: str, default_branch: str = None, cache_ttl: float = 60):
         """
         Initialize the GitRepository with GitHub URL and API token.
-        
+
         Args:
             url (str): GitHub repository URL (e.g., "username/repository" or full URL)
             api_token (str): GitHub personal access token
             default_branch (str): Default branch to use for operations (if None, uses repo default)
+            cache_ttl (float): Seconds a cached file is served before it is revalidated with GitHub
         """
         self.api_token = api_token
-        self.github = Github(api_token)
-        
+        self.cache_ttl = cache_ttl
+
+        # (repo, branch, path) -> (etag, sha, raw content, fetched_at)
+        self._cache: dict[tuple[str, str, str], tuple[Optional[str], str, bytes, float]] = {}
+
+        # (repo, branch) -> (etag, {path: sha})
+        self._tree_cache: dict[tuple[str, str], tuple[Optional[str], dict]] = {}
+
+        self._upload_slots = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
         # Extract repository name from URL
         if url.startswith(('http://', 'https://')):
             # Extract from full URL
@@ -29,194 +62,527 @@ class GitRepository:
         else:
             # Assume it's already in "username/repository" format
             self.repo_name = url
-            
+
+        headers = {
+            "Authorization": f"Bearer {api_token}",
+            "Accept": "application/vnd.github+json",
+        }
+
+        # Shared client so every tool call reuses the same pooled connection
+        self.client = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            http2=True,
+            headers=headers,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=KEEPALIVE_EXPIRY),
+        )
+
+        # Load the repository metadata once at startup, before the event loop is running,
+        # so no tool call has to resolve it
         try:
-            self.repo = self.github.get_repo(self.repo_name)
-            self.default_branch = default_branch or self.repo.default_branch
-        except GithubException as e:
+            started = time.monotonic()
+            response = httpx.get(f"{GITHUB_API_URL}/repos/{self.repo_name}", headers=headers)
+            response.raise_for_status()
+            self.repo = response.json()
+            self.default_branch = default_branch or self.repo["default_branch"]
+        except httpx.HTTPError as e:
             raise ValueError(f"Failed to access repository {self.repo_name}: {e}")
-    
-    def write_file(self, filepath: str, content: str, commit_message: Optional[str] = None, branch: Optional[str] = None) -> bool:
+
+        elapsed_ms = (time.monotonic() - started) * 1000
+        print(f"Loaded repository {self.repo_name} (id {self.repo['id']}, default branch {self.default_branch}) in {elapsed_ms:.0f}ms")
+
+    def _contents_url(self, filepath: str) -> str:
+        return f"/repos/{self.repo_name}/contents/{filepath}"
+
+    async def _fetch(self, filepath: str, branch: str, max_age: Optional[float] = None) -> Optional[tuple[str, bytes]]:
+        """
+        Return (sha, raw content) of a file, or None if it does not exist.
+
+        Cached entries younger than max_age (defaults to the cache TTL) are served
+        without a request, older ones are revalidated with If-None-Match so an
+        unchanged file costs a body-less 304.
+        """
+        key = (self.repo_name, branch, filepath)
+        cached = self._cache.get(key)
+        if max_age is None:
+            max_age = self.cache_ttl
+        if cached is not None and time.monotonic() - cached[3] < max_age:
+            return cached[1], cached[2]
+
+        headers = {}
+        if cached is not None and cached[0] is not None:
+            headers["If-None-Match"] = cached[0]
+
+        response = await self.client.get(self._contents_url(filepath), params={"ref": branch}, headers=headers)
+        if response.status_code == 304:
+            etag, sha, content, _ = cached
+            self._cache[key] = (etag, sha, content, time.monotonic())
+            return sha, content
+        if response.status_code == 404:
+            self._cache.pop(key, None)
+            return None
+        response.raise_for_status()
+
+        data = response.json()
+        if data.get("encoding") == "base64":
+            content = base64.b64decode(data["content"])
+        else:
+            # Files over 1 MB come without content, they have to be read through the blobs API
+            content = await self._get_blob(data["sha"])
+        self._cache[key] = (response.headers.get("ETag"), data["sha"], content, time.monotonic())
+        return data["sha"], content
+
+    async def _get_blob(self, sha: str) -> bytes:
+        """Download the raw content of a blob, which works for files of any size."""
+        response = await self.client.get(f"/repos/{self.repo_name}/git/blobs/{sha}")
+        response.raise_for_status()
+        return base64.b64decode(response.json()["content"])
+
+    async def _dir_shas(self, dirpath: str, ref: str) -> dict:
+        """Get the blob SHAs of the files directly in a directory at a branch or commit, without their content."""
+        response = await self.client.get(self._contents_url(dirpath), params={"ref": ref})
+        if response.status_code == 404:
+            return {}
+        response.raise_for_status()
+        return {item["path"]: item["sha"] for item in response.json() if item["type"] == "file"}
+
+    async def head_file(self, filepath: str, branch: Optional[str] = None) -> Optional[str]:
+        """
+        Check that a file exists and get its current blob SHA without reading it.
+
+        The file is always checked with GitHub, so the SHA can be passed on to write_file
+        or delete_file. A cached file costs a body-less 304, other files are looked up in
+        the listing of their directory, which carries SHAs but no content.
+
+        Args:
+            filepath (str): Path to the file in the repository
+            branch (Optional[str]): Branch to check. If None, uses default branch.
+
+        Returns:
+            Optional[str]: Blob SHA of the file, None if it does not exist or on error
+        """
+        target_branch = branch or self.default_branch
+        key = (self.repo_name, target_branch, filepath)
+        try:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] is not None:
+                response = await self.client.get(
+                    self._contents_url(filepath),
+                    params={"ref": target_branch},
+                    headers={"If-None-Match": cached[0]},
+                )
+                if response.status_code == 304:
+                    self._cache[key] = (cached[0], cached[1], cached[2], time.monotonic())
+                    return cached[1]
+                if response.status_code == 404:
+                    self._cache.pop(key, None)
+                    return None
+                response.raise_for_status()
+                return response.json()["sha"]
+
+            dirpath = filepath.rpartition('/')[0]
+            return (await self._dir_shas(dirpath, target_branch)).get(filepath)
+        except httpx.HTTPError as e:
+            print(f"Error checking {filepath} on branch {target_branch}: {e}")
+            return None
+
+    async def write_file(self, filepath: str, content: Union[str, bytes], commit_message: Optional[str] = None, branch: Optional[str] = None, sha: Optional[str] = None) -> bool:
         """
         Write content to a file in the GitHub repository.
-        
+
         Args:
             filepath (str): Path to the file in the repository
-            content (str): Content to write to the file
+            content (Union[str, bytes]): Content to write to the file, bytes are sent as is
             commit_message (Optional[str]): Custom commit message. If None, uses default messages.
             branch (Optional[str]): Branch to write to. If None, uses default branch.
-            
+            sha (Optional[str]): Current blob SHA of the file, as returned by head_file. If None, it is looked up.
+
         Returns:
             bool: True if successful, False otherwise
         """
+        target_branch = branch or self.default_branch
         try:
-            target_branch = branch or self.default_branch
-            
-            # Try to get the file first
-            try:
-                file = self.repo.get_contents(filepath, ref=target_branch)
+            if sha is None:
+                # Try to get the file first, always revalidating so the sha is current
+                existing = await self._fetch(filepath, target_branch, max_age=0)
+                sha = existing[0] if existing is not None else None
+
+            # Encoded to bytes once, only the base64 form goes into the request
+            content_bytes = _encode(content)
+            payload = {
+                "content": base64.b64encode(content_bytes).decode('ascii'),
+                "branch": target_branch,
+            }
+            if sha is not None:
                 # File exists, update it
-                update_message = commit_message if commit_message else f"Update {filepath}"
-                self.repo.update_file(
-                    file.path, 
-                    update_message, 
-                    content, 
-                    file.sha,
-                    branch=target_branch
-                )
-                print(f"Updated {filepath} on branch {target_branch}")
-            except GithubException:
+                payload["message"] = commit_message if commit_message else f"Update {filepath}"
+                payload["sha"] = sha
+            else:
                 # File doesn't exist, create it
-                create_message = commit_message if commit_message else f"Create {filepath}"
-                self.repo.create_file(
-                    filepath, 
-                    create_message, 
-                    content,
-                    branch=target_branch
-                )
+                payload["message"] = commit_message if commit_message else f"Create {filepath}"
+
+            response = await self.client.put(self._contents_url(filepath), json=payload)
+            response.raise_for_status()
+
+            # Keep the written content cached so the next read needs no request
+            new_sha = response.json()["content"]["sha"]
+            self._cache[(self.repo_name, target_branch, filepath)] = (None, new_sha, content_bytes, time.monotonic())
+
+            if sha is not None:
+                print(f"Updated {filepath} on branch {target_branch}")
+            else:
                 print(f"Created {filepath} on branch {target_branch}")
-            
+
             return True
-            
-        except GithubException as e:
+
+        except httpx.HTTPError as e:
             print(f"Error writing to {filepath} on branch {target_branch}: {e}")
             return False
-    
-    def read_file(self, filepath: str, branch: Optional[str] = None) -> Optional[str]:
+
+    async def _create_blob(self, content: bytes) -> str:
+        """Upload file content as a blob and return its SHA."""
+        async with self._upload_slots:
+            response = await self.client.post(
+                f"/repos/{self.repo_name}/git/blobs",
+                json={"content": base64.b64encode(content).decode('ascii'), "encoding": "base64"},
+            )
+        response.raise_for_status()
+        return response.json()["sha"]
+
+    async def commit_files(self, files: dict, message: str, branch: Optional[str] = None, base_shas: Optional[dict] = None) -> bool:
+        """
+        Write several files to the GitHub repository in a single commit.
+
+        Args:
+            files (dict): Mapping of file path to the content to write, as str or bytes
+            message (str): Commit message
+            branch (Optional[str]): Branch to commit to. If None, uses default branch.
+            base_shas (Optional[dict]): Mapping of file path to the blob SHA it was read at, None for a file
+                read as missing. The commit is aborted if any of them changed on the branch since.
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        target_branch = branch or self.default_branch
+        try:
+            contents = {filepath: _encode(content) for filepath, content in files.items()}
+
+            # The blobs are uploaded while the branch, which carries both the head
+            # commit and its tree, is read
+            response, *blob_shas = await asyncio.gather(
+                self.client.get(f"/repos/{self.repo_name}/branches/{target_branch}"),
+                *(self._create_blob(content) for content in contents.values()),
+            )
+            response.raise_for_status()
+            head = response.json()["commit"]
+            base_commit_sha = head["sha"]
+            base_tree_sha = head["commit"]["tree"]["sha"]
+
+            if base_shas:
+                # Checked at the head commit through directory listings, which carry SHAs but
+                # no content, later commits make the ref update below fail
+                dirpaths = dict.fromkeys(filepath.rpartition('/')[0] for filepath in base_shas)
+                current_shas = {}
+                for listing in await asyncio.gather(*(self._dir_shas(dirpath, base_commit_sha) for dirpath in dirpaths)):
+                    current_shas.update(listing)
+                changed = [filepath for filepath, sha in base_shas.items() if current_shas.get(filepath) != sha]
+                if changed:
+                    print(f"Error committing {', '.join(files)} to branch {target_branch}: {', '.join(changed)} changed since read")
+                    return False
+
+            response = await self.client.post(
+                f"/repos/{self.repo_name}/git/trees",
+                json={
+                    "base_tree": base_tree_sha,
+                    "tree": [
+                        {"path": filepath, "mode": "100644", "type": "blob", "sha": sha}
+                        for filepath, sha in zip(contents, blob_shas)
+                    ],
+                },
+            )
+            response.raise_for_status()
+            tree_sha = response.json()["sha"]
+
+            response = await self.client.post(
+                f"/repos/{self.repo_name}/git/commits",
+                json={"message": message, "tree": tree_sha, "parents": [base_commit_sha]},
+            )
+            response.raise_for_status()
+            commit_sha = response.json()["sha"]
+
+            # Not forced, so a concurrent commit on the branch makes this fail instead of being lost
+            response = await self.client.patch(
+                f"/repos/{self.repo_name}/git/refs/heads/{target_branch}",
+                json={"sha": commit_sha},
+            )
+            response.raise_for_status()
+
+            now = time.monotonic()
+            for (filepath, content), sha in zip(contents.items(), blob_shas):
+                self._cache[(self.repo_name, target_branch, filepath)] = (None, sha, content, now)
+
+            print(f"Committed {', '.join(files)} to branch {target_branch}")
+            return True
+
+        except httpx.HTTPError as e:
+            print(f"Error committing {', '.join(files)} to branch {target_branch}: {e}")
+            return False
+
+    async def read_file_bytes(self, filepath: str, branch: Optional[str] = None) -> Optional[bytes]:
+        """
+        Read the raw content of a file in the GitHub repository, without decoding it.
+
+        Args:
+            filepath (str): Path to the file in the repository
+            branch (Optional[str]): Branch to read from. If None, uses default branch.
+
+        Returns:
+            Optional[bytes]: File content if successful, None otherwise
+        """
+        target_branch = branch or self.default_branch
+        try:
+            file = await self._fetch(filepath, target_branch)
+            if file is None:
+                print(f"Error reading {filepath} from branch {target_branch}: file not found")
+                return None
+            return file[1]
+        except httpx.HTTPError as e:
+            print(f"Error reading {filepath} from branch {target_branch}: {e}")
+            return None
+
+    async def read_file_with_sha(self, filepath: str, branch: Optional[str] = None) -> Optional[tuple[str, bytes]]:
+        """
+        Read the current blob SHA and raw content of a file before modifying it.
+
+        The file is always revalidated with GitHub rather than served from the cache,
+        and passing the SHA on to write_file makes the write fail if the file changed
+        in the meantime instead of overwriting that change.
+
+        Args:
+            filepath (str): Path to the file in the repository
+            branch (Optional[str]): Branch to read from. If None, uses default branch.
+
+        Returns:
+            Optional[tuple[str, bytes]]: (blob SHA, file content) if successful, None otherwise
+        """
+        target_branch = branch or self.default_branch
+        try:
+            file = await self._fetch(filepath, target_branch, max_age=0)
+            if file is None:
+                print(f"Error reading {filepath} from branch {target_branch}: file not found")
+            return file
+        except httpx.HTTPError as e:
+            print(f"Error reading {filepath} from branch {target_branch}: {e}")
+            return None
+
+    async def read_file(self, filepath: str, branch: Optional[str] = None) -> Optional[str]:
         """
         Read content from a file in the GitHub repository.
-        
+
         Args:
             filepath (str): Path to the file in the repository
             branch (Optional[str]): Branch to read from. If None, uses default branch.
-            
+
         Returns:
             Optional[str]: File content if successful, None otherwise
         """
+        content = await self.read_file_bytes(filepath, branch)
+        return content.decode('utf-8') if content is not None else None
+
+    async def get_tree(self, branch: Optional[str] = None, recursive: bool = True) -> dict:
+        """
+        Get the blob SHAs of the files in a branch with a single request.
+
+        Args:
+            branch (Optional[str]): Branch to read the tree of. If None, uses default branch.
+            recursive (bool): Whether to include files in subdirectories
+
+        Returns:
+            dict: Mapping of file path to blob SHA, empty on error
+        """
+        target_branch = branch or self.default_branch
         try:
-            target_branch = branch or self.default_branch
-            file = self.repo.get_contents(filepath, ref=target_branch)
-            return file.decoded_content.decode('utf-8')
-        except GithubException as e:
-            print(f"Error reading {filepath} from branch {target_branch}: {e}")
+            key = (self.repo_name, target_branch)
+            cached = self._tree_cache.get(key) if recursive else None
+            headers = {"If-None-Match": cached[0]} if cached is not None and cached[0] is not None else {}
+
+            response = await self.client.get(
+                f"/repos/{self.repo_name}/git/trees/{target_branch}",
+                params={"recursive": 1} if recursive else None,
+                headers=headers,
+            )
+            if response.status_code == 304:
+                return cached[1]
+            response.raise_for_status()
+
+            data = response.json()
+            if data.get("truncated"):
+                print(f"Warning: tree of branch {target_branch} is truncated")
+            tree = {item["path"]: item["sha"] for item in data["tree"] if item["type"] == "blob"}
+            if recursive:
+                self._tree_cache[key] = (response.headers.get("ETag"), tree)
+            return tree
+        except httpx.HTTPError as e:
+            print(f"Error getting tree of branch {target_branch}: {e}")
+            return {}
+
+    async def read_blob(self, filepath: str, sha: str, branch: Optional[str] = None) -> Optional[bytes]:
+        """
+        Read a file by its blob SHA, reusing the cached content when the SHA is unchanged.
+
+        Args:
+            filepath (str): Path of the file in the repository, used as the cache key
+            sha (str): Blob SHA of the file, as returned by get_tree
+            branch (Optional[str]): Branch the SHA was read from. If None, uses default branch.
+
+        Returns:
+            Optional[bytes]: Raw file content if successful, None otherwise
+        """
+        target_branch = branch or self.default_branch
+        key = (self.repo_name, target_branch, filepath)
+        cached = self._cache.get(key)
+        if cached is not None and cached[1] == sha:
+            # The tree just confirmed this content is current
+            self._cache[key] = (cached[0], sha, cached[2], time.monotonic())
+            return cached[2]
+
+        try:
+            content = await self._get_blob(sha)
+            self._cache[key] = (None, sha, content, time.monotonic())
+            return content
+        except httpx.HTTPError as e:
+            print(f"Error reading blob {sha} of {filepath}: {e}")
             return None
-    
-    def list_files(self, path: str = "", branch: Optional[str] = None) -> list:
+
+    async def list_files(self, path: str = "", branch: Optional[str] = None) -> list:
         """
         List files in the repository.
-        
+
         Args:
             path (str): Directory path to list (empty string for root)
             branch (Optional[str]): Branch to list files from. If None, uses default branch.
-            
+
         Returns:
             list: List of file paths
         """
-        try:
-            target_branch = branch or self.default_branch
-            contents = self.repo.get_contents(path, ref=target_branch)
-            files = []
-            
-            for content in contents:
-                if content.type == "dir":
-                    files.extend(self.list_files(content.path, target_branch))
-                else:
-                    files.append(content.path)
-            
-            return files
-        except GithubException as e:
-            print(f"Error listing files from branch {target_branch}: {e}")
-            return []
-    
-    def delete_file(self, filepath: str, commit_message: Optional[str] = None, branch: Optional[str] = None) -> bool:
+        # The whole tree comes back in one request, subdirectories included
+        tree = await self.get_tree(branch, recursive=True)
+        path = path.strip('/')
+        prefix = f"{path}/" if path else ""
+        return [filepath for filepath in tree if filepath.startswith(prefix)]
+
+    async def delete_file(self, filepath: str, commit_message: Optional[str] = None, branch: Optional[str] = None, sha: Optional[str] = None) -> bool:
         """
         Delete a file from the GitHub repository.
-        
+
         Args:
             filepath (str): Path to the file in the repository to delete
             commit_message (Optional[str]): Custom commit message. If None, uses default message.
             branch (Optional[str]): Branch to delete from. If None, uses default branch.
-            
+            sha (Optional[str]): Current blob SHA of the file, as returned by head_file. If None, it is looked up.
+
         Returns:
             bool: True if successful, False otherwise
         """
+        target_branch = branch or self.default_branch
         try:
-            target_branch = branch or self.default_branch
-            
-            # Get the file to delete
-            file = self.repo.get_contents(filepath, ref=target_branch)
-            
+            if sha is None:
+                # Get the file to delete
+                existing = await self._fetch(filepath, target_branch, max_age=0)
+                if existing is None:
+                    print(f"Error deleting {filepath} from branch {target_branch}: file not found")
+                    return False
+                sha = existing[0]
+
             # Delete the file
             delete_message = commit_message if commit_message else f"Delete {filepath}"
-            self.repo.delete_file(
-                file.path,
-                delete_message,
-                file.sha,
-                branch=target_branch
+            response = await self.client.request(
+                "DELETE",
+                self._contents_url(filepath),
+                json={"message": delete_message, "sha": sha, "branch": target_branch},
             )
+            response.raise_for_status()
+            self._cache.pop((self.repo_name, target_branch, filepath), None)
             print(f"Deleted {filepath} from branch {target_branch}")
             return True
-            
-        except GithubException as e:
+
+        except httpx.HTTPError as e:
             print(f"Error deleting {filepath} from branch {target_branch}: {e}")
             return False
-    
-    def list_branches(self) -> list:
+
+    async def list_branches(self) -> list:
         """
         List all branches in the repository.
-        
+
         Returns:
             list: List of branch names
         """
         try:
-            branches = self.repo.get_branches()
-            return [branch.name for branch in branches]
-        except GithubException as e:
+            branches = []
+            url = f"/repos/{self.repo_name}/branches"
+            params = {"per_page": 100}
+            while url:
+                response = await self.client.get(url, params=params)
+                response.raise_for_status()
+                branches.extend(branch["name"] for branch in response.json())
+                # Follow pagination, the next link already carries the query string
+                url = response.links.get("next", {}).get("url")
+                params = None
+            return branches
+        except httpx.HTTPError as e:
             print(f"Error listing branches: {e}")
             return []
-    
-    def create_branch(self, branch_name: str, from_branch: Optional[str] = None) -> bool:
+
+    async def create_branch(self, branch_name: str, from_branch: Optional[str] = None) -> bool:
         """
         Create a new branch in the repository.
-        
+
         Args:
             branch_name (str): Name of the new branch
             from_branch (Optional[str]): Branch to create from. If None, uses default branch.
-            
+
         Returns:
             bool: True if successful, False otherwise
         """
+        source_branch = from_branch or self.default_branch
         try:
-            source_branch = from_branch or self.default_branch
-            source_ref = self.repo.get_git_ref(f"heads/{source_branch}")
-            self.repo.create_git_ref(f"refs/heads/{branch_name}", source_ref.object.sha)
+            response = await self.client.get(f"/repos/{self.repo_name}/git/ref/heads/{source_branch}")
+            response.raise_for_status()
+            source_sha = response.json()["object"]["sha"]
+
+            response = await self.client.post(
+                f"/repos/{self.repo_name}/git/refs",
+                json={"ref": f"refs/heads/{branch_name}", "sha": source_sha},
+            )
+            response.raise_for_status()
             print(f"Created branch {branch_name} from {source_branch}")
             return True
-        except GithubException as e:
+        except httpx.HTTPError as e:
             print(f"Error creating branch {branch_name}: {e}")
             return False
-    
-    def get_branch_info(self, branch_name: Optional[str] = None) -> Optional[dict]:
+
+    async def get_branch_info(self, branch_name: Optional[str] = None) -> Optional[dict]:
         """
         Get information about a specific branch.
-        
+
         Args:
             branch_name (Optional[str]): Name of the branch. If None, uses default branch.
-            
+
         Returns:
             Optional[dict]: Branch information if successful, None otherwise
         """
+        target_branch = branch_name or self.default_branch
         try:
-            target_branch = branch_name or self.default_branch
-            branch = self.repo.get_branch(target_branch)
+            response = await self.client.get(f"/repos/{self.repo_name}/branches/{target_branch}")
+            response.raise_for_status()
+            branch = response.json()
             return {
-                "name": branch.name,
-                "commit_sha": branch.commit.sha,
-                "commit_message": branch.commit.commit.message,
-                "commit_author": branch.commit.commit.author.name,
-                "commit_date": branch.commit.commit.author.date.isoformat(),
-                "protected": branch.protected,
+                "name": branch["name"],
+                "commit_sha": branch["commit"]["sha"],
+                "commit_message": branch["commit"]["commit"]["message"],
+                "commit_author": branch["commit"]["commit"]["author"]["name"],
+                "commit_date": branch["commit"]["commit"]["author"]["date"],
+                "protected": branch["protected"],
             }
-        except GithubException as e:
+        except httpx.HTTPError as e:
             print(f"Error getting branch info for {target_branch}: {e}")
             return None
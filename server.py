@@ -1,11 +1,13 @@
 import os
 import re
-import json
-from datetime import datetime
+import asyncio
+import time
+import orjson
+from functools import lru_cache
 from typing import Annotated, Optional
 from fastmcp import FastMCP
 from fastmcp.server.auth import StaticTokenVerifier
-from git import GitRepository
+from git import GitRepository, blob_sha
 from pypinyin import lazy_pinyin, Style
 
 mcp = FastMCP("Blog MCP Server")
@@ -32,13 +34,55 @@ github_api_token = os.getenv("GITHUB_API_TOKEN")
 if github_api_token is None:
     raise ValueError("GITHUB_API_TOKEN is not set")
 
+# Seconds a file read from GitHub is served from memory before being revalidated
+cache_ttl = float(os.getenv("BLOG_MCP_CACHE_TTL", "60"))
+
 # Initialize GitRepository instance
 try:
-    git_repo = GitRepository(github_repo_url, github_api_token)
+    git_repo = GitRepository(github_repo_url, github_api_token, cache_ttl=cache_ttl)
 except Exception as e:
     raise ValueError(f"Failed to initialize GitRepository: {e}")
 
+# Articles create_articles accepts in one call, each one is a separate blob upload
+MAX_BATCH_ARTICLES = 20
+
+# ASCII characters that are neither word characters nor hyphens, mapped to a hyphen
+_NON_WORD_TABLE = {i: '-' for i in range(128) if not (chr(i).isalnum() or chr(i) in '-_')}
+# Fallback for non-ASCII characters left over by the pinyin conversion
+_NON_WORD_RE = re.compile(r'[^\w\-]')
+
+
+def _dump_meta(meta_data: dict) -> bytes:
+    """Serialize _meta.json content, keeping key order since it drives the sidebar order"""
+    return orjson.dumps(meta_data, option=orjson.OPT_INDENT_2)
+
+
+# Parsed _meta.json per category: category -> (blob SHA, parsed data)
+_meta_cache: dict[str, tuple[str, dict]] = {}
+
+
+def parse_meta(category: str, sha: str, meta_content: bytes) -> dict:
+    """Parse _meta.json content of a category, reusing the parsed data while its blob SHA is unchanged"""
+    cached = _meta_cache.get(category)
+    if cached is None or cached[0] != sha:
+        cached = (sha, orjson.loads(meta_content))
+        _meta_cache[category] = cached
+    
+    # Callers modify the result, keep the cached data intact
+    return dict(cached[1])
+
 
+async def put_meta(category: str, meta_data: dict, commit_message: str, sha: str) -> bool:
+    """Write _meta.json of a category over the version with the given SHA and keep the written data cached"""
+    meta_content = _dump_meta(meta_data)
+    if not await git_repo.write_file(f"pages/{category}/_meta.json", meta_content, commit_message, sha=sha):
+        return False
+    
+    _meta_cache[category] = (blob_sha(meta_content), meta_data)
+    return True
+
+
+@lru_cache(maxsize=1024)
 def title_to_filename(title: str) -> str:
     """Convert title to valid filename with pinyin for Chinese characters"""
     # Convert Chinese characters to pinyin
@@ -46,10 +90,13 @@ def title_to_filename(title: str) -> str:
     filename = ''.join(pinyin_list)
     
     # Replace spaces and special characters with hyphens
-    filename = re.sub(r'[^\w\-]', '-', filename)
+    filename = filename.translate(_NON_WORD_TABLE)
+    if not filename.isascii():
+        filename = _NON_WORD_RE.sub('-', filename)
     
     # Remove multiple consecutive hyphens
-    filename = re.sub(r'-+', '-', filename)
+    while '--' in filename:
+        filename = filename.replace('--', '-')
     
     # Remove leading and trailing hyphens
     filename = filename.strip('-')
@@ -59,24 +106,36 @@ def title_to_filename(title: str) -> str:
     
     return filename
 
-def has_markdown_title(content: str) -> bool:
-    """Check if content has a markdown title (first non-empty line starts with #)"""
-    content = content.strip()
-    if not content:
-        return False
-    
-    first_line = content.split('\n')[0]
-    return first_line.startswith('# ')
-
 def add_title_to_content(title: str, content: str) -> str:
-    """Add title as markdown header if content doesn't have one"""
-    if has_markdown_title(content):
+    """Add title as markdown header if content doesn't have one (first non-empty line starts with #)"""
+    if content.lstrip().startswith('# '):
         return content
     else:
         return f"# {title}\n\n{content}"
 
+def build_article_content(title: str, content: str) -> str:
+    """Add the title header if needed and the AI creation footer to a new article"""
+    final_content = add_title_to_content(title, content)
+    
+    # Add AI creation timestamp at the end
+    current_time = time.strftime("%Y-%m-%d %H:%M:%S")
+    ai_footer = f"\n\n---\n> This article was created by AI at {current_time} and is for reference only."
+    return final_content + ai_footer
+
+def parse_meta_for_create(category: str, meta_file: Optional[tuple[str, bytes]]) -> dict:
+    """Parse _meta.json that new articles are added to, starting empty if it is missing or invalid"""
+    if meta_file is None:
+        # Create new _meta.json if it doesn't exist
+        return {}
+    
+    try:
+        return parse_meta(category, *meta_file)
+    except orjson.JSONDecodeError:
+        # If JSON is invalid, create new structure
+        return {}
+
 @mcp.tool
-def create_new_article(
+async def create_new_article(
     title: Annotated[str, "Title of the new article"],
     content: Annotated[str, "Content of the new article, should be in Markdown format"],
     category: Annotated[Optional[str], "Category of the new article, should be one of the following: web3, note, default is note"] = "note",
@@ -87,44 +146,29 @@ def create_new_article(
         return "Error: Category should be one of the following: web3, note"
     
     try:
+        # Start reading _meta.json while the article content is prepared
+        meta_filepath = f"pages/{category}/_meta.json"
+        meta_task = asyncio.create_task(git_repo.read_file_with_sha(meta_filepath))
+        
         # 1. Convert title to filename
         filename = title_to_filename(title)
         filepath = f"pages/{category}/{filename}.md"
         
-        # 2. Check and add title to content if needed
-        final_content = add_title_to_content(title, content)
-        
-        # Add AI creation timestamp at the end
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        ai_footer = f"\n\n---\n> This article was created by AI at {current_time} and is for reference only."
-        final_content += ai_footer
+        # 2. Check and add title to content if needed, with the AI footer
+        final_content = build_article_content(title, content)
         
         # 3. Read and update _meta.json
-        meta_filepath = f"pages/{category}/_meta.json"
-        meta_content = git_repo.read_file(meta_filepath)
-        
-        if meta_content is None:
-            # Create new _meta.json if it doesn't exist
-            meta_data = {filename: title}
-        else:
-            # Parse existing _meta.json
-            try:
-                meta_data = json.loads(meta_content)
-            except json.JSONDecodeError:
-                # If JSON is invalid, create new structure
-                meta_data = {}
-            
-            # Add new article to meta data
-            meta_data[filename] = title
-        
-        # Write updated _meta.json
-        updated_meta_content = json.dumps(meta_data, ensure_ascii=False, indent=4)
-        if not git_repo.write_file(meta_filepath, updated_meta_content, f"Add article '{title}' to _meta.json"):
-            return f"Error: Failed to update _meta.json"
+        meta_file = await meta_task
+        meta_sha = meta_file[0] if meta_file is not None else None
+        meta_data = parse_meta_for_create(category, meta_file)
+        meta_data[filename] = title
+        updated_meta_content = _dump_meta(meta_data)
         
-        # 4. Create the article file
-        if not git_repo.write_file(filepath, final_content, f"Create new article: {title}"):
+        # 4. Write _meta.json and the article file in a single commit
+        files = {meta_filepath: updated_meta_content, filepath: final_content}
+        if not await git_repo.commit_files(files, f"Create new article: {title}", base_shas={meta_filepath: meta_sha}):
             return f"Error: Failed to create article file {filepath}"
+        _meta_cache[category] = (blob_sha(updated_meta_content), meta_data)
         
         return f"Successfully created article '{title}' at {filepath}"
         
@@ -133,7 +177,67 @@ def create_new_article(
 
 
 @mcp.tool
-def update_article(
+async def create_articles(
+    articles: Annotated[list[dict[str, str]], "Articles to create, each with 'title', 'content' in Markdown format and optional 'category' (web3, note, default is note)"],
+) -> str:
+    """Create several new articles at once, in a single commit"""
+    
+    if not articles:
+        return "Error: No articles provided"
+    if len(articles) > MAX_BATCH_ARTICLES:
+        return f"Error: At most {MAX_BATCH_ARTICLES} articles can be created at once"
+    
+    for article in articles:
+        if not article.get("title") or "content" not in article:
+            return "Error: Each article should have a title and content"
+        if article.get("category", "note") not in ["web3", "note"]:
+            return "Error: Category should be one of the following: web3, note"
+    
+    try:
+        # Read the current _meta.json of every category involved concurrently
+        categories = list(dict.fromkeys(article.get("category", "note") for article in articles))
+        meta_files = await asyncio.gather(
+            *(git_repo.read_file_with_sha(f"pages/{category}/_meta.json") for category in categories)
+        )
+        metas = {}
+        base_shas = {}
+        for category, meta_file in zip(categories, meta_files):
+            metas[category] = parse_meta_for_create(category, meta_file)
+            base_shas[f"pages/{category}/_meta.json"] = meta_file[0] if meta_file is not None else None
+        
+        # Every article and updated _meta.json goes into one commit, separate commits
+        # on the same branch would race each other on the branch head and _meta.json
+        files = {}
+        titles = {}
+        for article in articles:
+            title = article["title"]
+            category = article.get("category", "note")
+            filename = title_to_filename(title)
+            filepath = f"pages/{category}/{filename}.md"
+            if filepath in titles:
+                return f"Error: Articles '{titles[filepath]}' and '{title}' would both be created at {filepath}"
+            
+            files[filepath] = build_article_content(title, article["content"])
+            metas[category][filename] = title
+            titles[filepath] = title
+        
+        meta_contents = {category: _dump_meta(meta_data) for category, meta_data in metas.items()}
+        for category, meta_content in meta_contents.items():
+            files[f"pages/{category}/_meta.json"] = meta_content
+        
+        if not await git_repo.commit_files(files, f"Create {len(articles)} new articles", base_shas=base_shas):
+            return "Error: Failed to create article files"
+        for category, meta_content in meta_contents.items():
+            _meta_cache[category] = (blob_sha(meta_content), metas[category])
+        
+        return f"Successfully created {len(articles)} articles at {', '.join(titles)}"
+        
+    except Exception as e:
+        return f"Error creating articles: {str(e)}"
+
+
+@mcp.tool
+async def update_article(
     path: Annotated[str, "Path to the article file (e.g., 'pages/note/article-name.md')"],
     new_content: Annotated[str, "New content for the article in Markdown format"],
     title: Annotated[Optional[str], "New title for the article. If provided, will update the title in _meta.json"] = None,
@@ -141,41 +245,45 @@ def update_article(
     """Update an existing article with new content and optionally update the title"""
     
     try:
-        # Check if the file exists
-        existing_content = git_repo.read_file(path)
-        if existing_content is None:
-            return f"Error: Article not found at path '{path}'"
-        
         # Extract category and filename from path
-        path_parts = path.split('/')
-        if len(path_parts) < 3 or not path_parts[0] == 'pages':
+        path_parts = path.rsplit('/', 2)
+        if len(path_parts) != 3 or path_parts[0] != 'pages':
             return f"Error: Invalid article path format. Expected 'pages/category/filename.md'"
         
         category = path_parts[1]
-        filename = path_parts[2].replace('.md', '')
+        filename = path_parts[2].removesuffix('.md')
+        meta_filepath = f"pages/{category}/_meta.json"
+        
+        # Check if the file exists, reading the current _meta.json alongside when the title changes
+        if title is not None:
+            sha, meta_file = await asyncio.gather(
+                git_repo.head_file(path),
+                git_repo.read_file_with_sha(meta_filepath),
+            )
+        else:
+            sha = await git_repo.head_file(path)
+        if sha is None:
+            return f"Error: Article not found at path '{path}'"
         
         # Update _meta.json if title is provided
         if title is not None:
-            meta_filepath = f"pages/{category}/_meta.json"
-            meta_content = git_repo.read_file(meta_filepath)
-            
-            if meta_content is not None:
+            if meta_file is not None:
+                meta_sha, meta_content = meta_file
                 try:
-                    meta_data = json.loads(meta_content)
+                    meta_data = parse_meta(category, meta_sha, meta_content)
                     if filename in meta_data:
                         meta_data[filename] = title
                         
                         # Write updated _meta.json
-                        updated_meta_content = json.dumps(meta_data, ensure_ascii=False, indent=4)
-                        if not git_repo.write_file(meta_filepath, updated_meta_content, f"Update article title '{filename}' in _meta.json"):
+                        if not await put_meta(category, meta_data, f"Update article title '{filename}' in _meta.json", meta_sha):
                             return f"Error: Failed to update _meta.json"
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     return f"Error: Invalid _meta.json format"
             else:
                 return f"Error: _meta.json not found for category '{category}'"
         
         # Update the article file
-        if not git_repo.write_file(path, new_content, f"Update article: {path}"):
+        if not await git_repo.write_file(path, new_content, f"Update article: {path}", sha=sha):
             return f"Error: Failed to update article at {path}"
         
         success_msg = f"Successfully updated article at {path}"
@@ -189,13 +297,13 @@ def update_article(
 
 
 @mcp.tool
-def get_article(
+async def get_article(
     path: Annotated[str, "Path to the article file (e.g., 'pages/note/article-name.md')"],
 ) -> str:
     """Get the content of an existing article"""
     
     try:
-        content = git_repo.read_file(path)
+        content = await git_repo.read_file(path)
         if content is None:
             return f"Error: Article not found at path '{path}'"
         
@@ -206,45 +314,46 @@ def get_article(
 
 
 @mcp.tool
-def delete_article(
+async def delete_article(
     path: Annotated[str, "Path to the article file (e.g., 'pages/note/article-name.md')"],
 ) -> str:
     """Delete an existing article and update _meta.json"""
     
     try:
-        # Check if the file exists
-        existing_content = git_repo.read_file(path)
-        if existing_content is None:
-            return f"Error: Article not found at path '{path}'"
-        
         # Extract category and filename from path
-        path_parts = path.split('/')
-        if len(path_parts) < 3 or not path_parts[0] == 'pages':
+        path_parts = path.rsplit('/', 2)
+        if len(path_parts) != 3 or path_parts[0] != 'pages':
             return f"Error: Invalid article path format. Expected 'pages/category/filename.md'"
         
         category = path_parts[1]
-        filename = path_parts[2].replace('.md', '')
-        
-        # Update _meta.json to remove the article
+        filename = path_parts[2].removesuffix('.md')
         meta_filepath = f"pages/{category}/_meta.json"
-        meta_content = git_repo.read_file(meta_filepath)
         
-        if meta_content is not None:
+        # Check if the file exists and read the current _meta.json at the same time
+        sha, meta_file = await asyncio.gather(
+            git_repo.head_file(path),
+            git_repo.read_file_with_sha(meta_filepath),
+        )
+        if sha is None:
+            return f"Error: Article not found at path '{path}'"
+        
+        # Update _meta.json to remove the article
+        if meta_file is not None:
+            meta_sha, meta_content = meta_file
             try:
-                meta_data = json.loads(meta_content)
+                meta_data = parse_meta(category, meta_sha, meta_content)
                 if filename in meta_data:
                     del meta_data[filename]
                     
                     # Write updated _meta.json
-                    updated_meta_content = json.dumps(meta_data, ensure_ascii=False, indent=4)
-                    if not git_repo.write_file(meta_filepath, updated_meta_content, f"Remove article '{filename}' from _meta.json"):
+                    if not await put_meta(category, meta_data, f"Remove article '{filename}' from _meta.json", meta_sha):
                         return f"Error: Failed to update _meta.json"
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # If JSON is invalid, continue with deletion
                 pass
         
         # Delete the article file
-        if not git_repo.delete_file(path, f"Delete article: {path}"):
+        if not await git_repo.delete_file(path, f"Delete article: {path}", sha=sha):
             return f"Error: Failed to delete article at {path}"
         
         return f"Successfully deleted article at {path}"
@@ -254,61 +363,58 @@ def delete_article(
 
 
 @mcp.tool
-def get_article_list(
+async def get_article_list(
     category: Annotated[Optional[str], "Category to filter articles (web3, note). If not provided, returns all categories"] = None,
 ) -> str:
     """Get list of articles with their paths and titles"""
     
     try:
-        result = {}
-        
         if category is not None:
             if category not in ["web3", "note"]:
                 return "Error: Category should be one of the following: web3, note"
-            
-            # Get articles for specific category
-            meta_filepath = f"pages/{category}/_meta.json"
-            meta_content = git_repo.read_file(meta_filepath)
-            
-            if meta_content is not None:
-                try:
-                    meta_data = json.loads(meta_content)
-                    for filename, title in meta_data.items():
-                        result[f"pages/{category}/{filename}.md"] = title
-                except json.JSONDecodeError:
-                    pass
+            categories = [category]
         else:
-            # Get articles for all categories
-            for cat in ["web3", "note"]:
-                meta_filepath = f"pages/{cat}/_meta.json"
-                meta_content = git_repo.read_file(meta_filepath)
-                
-                if meta_content is not None:
-                    try:
-                        meta_data = json.loads(meta_content)
-                        for filename, title in meta_data.items():
-                            result[f"pages/{cat}/{filename}.md"] = title
-                    except json.JSONDecodeError:
-                        pass
-        
-        return json.dumps(result, ensure_ascii=False, indent=2)
+            categories = ["web3", "note"]
+        
+        # One tree request tells which _meta.json files exist and their current blob sha,
+        # only blobs that changed since the last call are downloaded
+        tree = await git_repo.get_tree()
+        metas = [(cat, f"pages/{cat}/_meta.json") for cat in categories]
+        metas = [(cat, meta_filepath) for cat, meta_filepath in metas if meta_filepath in tree]
+        meta_contents = await asyncio.gather(
+            *(git_repo.read_blob(meta_filepath, tree[meta_filepath]) for _, meta_filepath in metas)
+        )
+        
+        result = {}
+        for (cat, meta_filepath), meta_content in zip(metas, meta_contents):
+            if meta_content is None:
+                continue
+            
+            try:
+                meta_data = parse_meta(cat, tree[meta_filepath], meta_content)
+                for filename, title in meta_data.items():
+                    result[f"pages/{cat}/{filename}.md"] = title
+            except orjson.JSONDecodeError:
+                pass
+        
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode('utf-8')
         
     except Exception as e:
         return f"Error getting article list: {str(e)}"
 
 
 @mcp.tool
-def deploy() -> str:
+async def deploy() -> str:
     """Create a deployment commit with @deploy comment to trigger deployment"""
     
     try:
         # Create/update .deploy-version file with current timestamp
         deploy_filepath = ".deploy-version"
-        current_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        current_timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         deploy_content = f"deploy-version: {current_timestamp}"
         
         # Create or update the .deploy-version file
-        if not git_repo.write_file(deploy_filepath, deploy_content, "@deploy"):
+        if not await git_repo.write_file(deploy_filepath, deploy_content, "@deploy"):
             return "Error: Failed to create/update .deploy-version file"
         
         return f"Successfully created deployment commit with @deploy (version: {current_timestamp})"